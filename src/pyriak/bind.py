@@ -70,12 +70,12 @@ class Binding(Generic[_T, _R_co]):
         return self.__wrapped__
 
     def __call__(self, space: "Space", event: _T, /) -> _R_co:
-        return self._callback_(space, event)
+        return self.__wrapped__(space, event)
 
     def __get__(
         self, obj: object | None, objtype: type | None = None
     ) -> _Callback[_T, _R_co]:
-        callback = self._callback_
+        callback = self.__wrapped__
         try:
             descr_get: Callable[
                 [_Callback[_T, _R_co], object | None, type | None], _Callback[_T, _R_co]
@@ -151,10 +151,11 @@ def bind(event_type, priority, /, *, key=_SENTINEL, keys=_SENTINEL):
     """
     if not isinstance(event_type, type):
         raise TypeError(f"{event_type!r} is not a type")
-    try:
-        hash(event_type)
-    except TypeError:
-        raise TypeError(f"{event_type!r} is not hashable") from None
+    if type(event_type) is not type:
+        try:
+            hash(event_type)
+        except TypeError:
+            raise TypeError(f"{event_type!r} is not hashable") from None
     if key is not _SENTINEL:
         if keys is not _SENTINEL:
             raise TypeError("bind() cannot be passed both 'key' and 'keys' kwargs")
@@ -3,8 +3,8 @@
 __all__ = ["Entity", "EntityId"]
 
 from collections.abc import Iterable, Iterator, KeysView
+from itertools import count
 from typing import TYPE_CHECKING, NewType, TypeVar, overload
-from uuid import uuid4
 
 from pyriak import _SENTINEL, dead_weakref
 
@@ -23,6 +23,9 @@ _T = TypeVar("_T")
 _D = TypeVar("_D")
 
 
+_next_id = count(1).__next__
+
+
 class Entity:
     """A mutable collection of components that represents an entity.
 
@@ -46,6 +49,7 @@ class Entity:
     Attributes:
         id: A unique integer identifier generated when the entity is created.
             This id can be used to weakly reference and store the entity.
+            By default, it is only unique within the current process.
     """
 
     __slots__ = "id", "_components", "_manager"
@@ -120,8 +124,8 @@ class Entity:
         manager = self._manager()
         for component in components:
             component_type = type(component)
-            if component_type in self_components:
-                other_component = self_components[component_type]
+            other_component = self_components.get(component_type, _SENTINEL)
+            if other_component is not _SENTINEL:
                 if other_component is component or other_component == component:
                     continue
                 if manager is not None:
@@ -178,11 +182,17 @@ class Entity:
         Args:
             *components: The components to be removed if in self.
         """
+        self_components = self._components
+        found: dict[type, object] = {}
         for component in components:
-            try:
-                self.remove(component)
-            except ValueError:
-                pass
+            component_type = type(component)
+            if component_type in found or component_type not in self_components:
+                continue
+            other_component = self_components[component_type]
+            if other_component is component or other_component == component:
+                found[component_type] = other_component
+        if found:
+            self.remove(*found.values())
 
     def __getitem__(self, component_type: type[_T], /) -> _T:
         return self._components[component_type]  # type: ignore[return-value]
@@ -242,16 +252,23 @@ class Entity:
         return f"{type(self).__name__}({list(self)})"
 
     def clear(self) -> None:
-        self.remove(*self)
+        self_components = self._components
+        components = list(self_components.values())
+        self_components.clear()
+        manager = self._manager()
+        if manager is not None:
+            for component in components:
+                manager._component_removed(self, component)
 
     @staticmethod
     def new_id() -> EntityId:
         """Return a new unique EntityId int.
 
-        The default implementation uses the `uuid` standard
-        library, returning the integer value of `uuid4()` which
-        is 128 bits long (16 bytes), the UUID standard.
-        Subclasses may implement their own generation method.
+        The default implementation returns consecutive integers from
+        a counter shared by the whole process, starting at 1.
+        These ids are unique within the process, not across processes.
+        Subclasses may implement their own generation method,
+        e.g. `uuid4().int` from the `uuid` standard library.
 
         This method is used by the Entity's `__init__()` method
         to generate the `id` attribute.
@@ -259,4 +276,4 @@ class Entity:
         Returns:
             A unique integer.
         """
-        return uuid4().int  # type: ignore[return-value]
+        return _next_id()  # type: ignore[return-value]
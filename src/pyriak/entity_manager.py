@@ -3,6 +3,7 @@
 __all__ = ["EntityManager", "QueryResult"]
 
 from collections.abc import Collection, Iterable, Iterator, KeysView, Set as AbstractSet
+from operator import itemgetter
 from typing import Any, Callable, TypeVar, overload
 from weakref import ref as weakref
 
@@ -76,7 +77,7 @@ class QueryResult:
         Returns:
             An iterator of components of that type, from the query's entities.
         """
-        return (entity[component_type] for entity in self.entities)
+        return map(itemgetter(component_type), self._entities.values())
 
     def zip(self, *component_types: type) -> Iterator[tuple[Any, ...]]:
         """Return an iterator of tuples of components.
@@ -102,10 +103,10 @@ class QueryResult:
         """
         if not component_types:
             component_types = self.types
-        return (
-            tuple([ent[comp_type] for comp_type in component_types])
-            for ent in self.entities
-        )
+        components = map(itemgetter(*component_types), self._entities.values())
+        if len(component_types) == 1:
+            return zip(components)
+        return components
 
     def zip_entity(self, *component_types: type) -> Iterator[tuple[Any, ...]]:
         """Return an iterator of tuples of the entity and its components.
@@ -130,10 +131,11 @@ class QueryResult:
         """
         if not component_types:
             component_types = self.types
-        return (
-            (ent, *[ent[comp_type] for comp_type in component_types])
-            for ent in self.entities
-        )
+        entities = self._entities.values()
+        get = itemgetter(*component_types)
+        if len(component_types) == 1:
+            return zip(entities, map(get, entities), strict=False)
+        return ((ent, *get(ent)) for ent in entities)
 
     __hash__ = None  # type: ignore[assignment]
 
@@ -184,12 +186,7 @@ class _Components:
         Returns:
             An iterator of components of that type, from the manager's entities.
         """
-        manager = self._manager()
-        entities = manager._entities
-        return (
-            entities[entity_id][component_type]
-            for entity_id in manager._type_cache.get(component_type, ())
-        )
+        return map(itemgetter(component_type), self._manager()(component_type))
 
     def types(self) -> KeysView[type]:
         return self._manager()._type_cache.keys()
@@ -203,7 +200,7 @@ class _Components:
             yield from reversed(entity)
 
     def __len__(self) -> int:
-        return sum([len(entity) for entity in self._manager()])
+        return self._manager()._component_count
 
     def __contains__(self, obj: object, /) -> bool:
         return obj in self._manager()._type_cache
@@ -231,7 +228,14 @@ class EntityManager:
             This is usually assigned the space's event queue.
     """
 
-    __slots__ = "_entities", "_type_cache", "components", "event_queue", "__weakref__"
+    __slots__ = (
+        "_entities",
+        "_type_cache",
+        "_component_count",
+        "components",
+        "event_queue",
+        "__weakref__",
+    )
 
     def __init__(
         self, entities: Iterable[Entity] = (), /, event_queue: EventQueue | None = None
@@ -251,6 +255,7 @@ class EntityManager:
         self.components = _Components(self)
         self._entities: dict[EntityId, Entity] = {}
         self._type_cache: dict[type, set[EntityId]] = {}
+        self._component_count = 0
         self.add(*entities)
 
     def add(self, *entities: Entity) -> None:
@@ -277,26 +282,33 @@ class EntityManager:
         self_entities = self._entities
         self_weakref: weakref[EntityManager] = weakref(self)
         event_queue = self.event_queue
-        for entity in entities:
-            entity_id = entity.id
-            if entity_id in self_entities:
-                raise ValueError(entity)
-            if entity._manager() is not None:
-                raise RuntimeError(f"{entity!r} already added to another manager")
-            self_entities[entity_id] = entity
-            entity._manager = self_weakref
-            for component_type in entity.types():
-                try:
-                    component_types[component_type].add(entity_id)
-                except KeyError:
-                    component_types[component_type] = {entity_id}
-            if event_queue is not None:
-                event_queue.extend(
-                    [
-                        EntityAdded(entity),
-                        *[ComponentAdded(entity, component) for component in entity],
-                    ]
-                )
+        events: list[object] = []
+        try:
+            for entity in entities:
+                entity_id = entity.id
+                if entity_id in self_entities:
+                    raise ValueError(entity)
+                manager = entity._manager
+                if manager is not dead_weakref and manager() is not None:
+                    raise RuntimeError(f"{entity!r} already added to another manager")
+                self_entities[entity_id] = entity
+                entity._manager = self_weakref
+                components = entity._components
+                self._component_count += len(components)
+                for component_type in components:
+                    entity_ids = component_types.get(component_type)
+                    if entity_ids is None:
+                        component_types[component_type] = {entity_id}
+                    else:
+                        entity_ids.add(entity_id)
+                if event_queue is not None:
+                    events.append(EntityAdded(entity))
+                    events.extend(
+                        [ComponentAdded(entity, comp) for comp in components.values()]
+                    )
+        finally:
+            if events and event_queue is not None:
+                event_queue.extend(events)
 
     def update(self, *entities: Entity) -> None:
         """Update self with an arbitrary number of entities.
@@ -310,8 +322,9 @@ class EntityManager:
         Raises:
             RuntimeError: If one of the entities is in another manager.
         """
+        self_entities = self._entities
         for entity in entities:
-            if entity not in self:
+            if entity.id not in self_entities:
                 self.add(entity)
 
     def create(self, *components: object) -> Entity:
@@ -349,25 +362,30 @@ class EntityManager:
         """
         type_cache = self._type_cache
         event_queue = self.event_queue
-        for entity in entities:
-            entity_id = entity.id
-            try:
-                del self._entities[entity_id]
-            except KeyError:
-                raise ValueError(entity) from None
-            entity._manager = dead_weakref
-            for component_type in entity.types():
-                component_type_entities = type_cache[component_type]
-                component_type_entities.remove(entity_id)
-                if not component_type_entities:
-                    del type_cache[component_type]
-            if event_queue is not None:
-                event_queue.extend(
-                    [
-                        *[ComponentRemoved(entity, component) for component in entity],
-                        EntityRemoved(entity),
-                    ]
-                )
+        events: list[object] = []
+        try:
+            for entity in entities:
+                entity_id = entity.id
+                try:
+                    del self._entities[entity_id]
+                except KeyError:
+                    raise ValueError(entity) from None
+                entity._manager = dead_weakref
+                components = entity._components
+                self._component_count -= len(components)
+                for component_type in components:
+                    component_type_entities = type_cache[component_type]
+                    component_type_entities.remove(entity_id)
+                    if not component_type_entities:
+                        del type_cache[component_type]
+                if event_queue is not None:
+                    events.extend(
+                        [ComponentRemoved(entity, comp) for comp in components.values()]
+                    )
+                    events.append(EntityRemoved(entity))
+        finally:
+            if events and event_queue is not None:
+                event_queue.extend(events)
 
     def discard(self, *entities: Entity) -> None:
         """Remove entities, skipping any not in self.
@@ -420,18 +438,29 @@ class EntityManager:
             raise TypeError("expected at least one component type")
         self_entities = self._entities
         type_cache = self._type_cache
+        if merge is set.intersection:
+            id_sets = []
+            for typ in component_types:
+                if typ not in type_cache:
+                    return QueryResult({}, component_types, merge)
+                id_sets.append(type_cache[typ])
+            if len(id_sets) == 1:
+                entity_ids = id_sets[0]
+            elif len(id_sets) == 2:  # noqa: PLR2004
+                entity_ids = id_sets[0].intersection(id_sets[1])
+            else:
+                # Keep the intermediate results small
+                id_sets.sort(key=len)
+                entity_ids = id_sets[0].intersection(*id_sets[1:])
+        else:
+            entity_ids = merge(
+                *[
+                    type_cache[typ] if typ in type_cache else set()  # noqa: SIM401
+                    for typ in component_types
+                ]
+            )
         return QueryResult(
-            {
-                entity_id: self_entities[entity_id]
-                for entity_id in merge(
-                    *[
-                        type_cache[typ]  # noqa: SIM401
-                        if typ in type_cache
-                        else set()
-                        for typ in component_types
-                    ]
-                )
-            },
+            {entity_id: self_entities[entity_id] for entity_id in entity_ids},
             component_types,
             merge,
         )
@@ -455,11 +484,7 @@ class EntityManager:
         Returns:
             An iterator of entities that have component_type.
         """
-        entities = self._entities
-        return (
-            entities[entity_id]
-            for entity_id in self._type_cache.get(component_type, ())
-        )
+        return map(self._entities.__getitem__, self._type_cache.get(component_type, ()))
 
     def __getitem__(self, entity_id: EntityId, /) -> Entity:
         return self._entities[entity_id]
@@ -523,22 +548,44 @@ class EntityManager:
         return obj in self._entities
 
     def clear(self) -> None:
-        self.remove(*self)
+        self_entities = self._entities
+        event_queue = self.event_queue
+        events: list[object] = []
+        for entity in self_entities.values():
+            entity._manager = dead_weakref
+            if event_queue is not None:
+                components = entity._components
+                events.extend(
+                    [ComponentRemoved(entity, comp) for comp in components.values()]
+                )
+                events.append(EntityRemoved(entity))
+        self_entities.clear()
+        self._type_cache.clear()
+        self._component_count = 0
+        if event_queue is not None:
+            event_queue.extend(events)
 
     def _component_added(self, entity: Entity, component: object, /) -> None:
-        try:
-            self._type_cache[type(component)].add(entity.id)
-        except KeyError:
-            self._type_cache[type(component)] = {entity.id}
+        component_type = type(component)
+        type_cache = self._type_cache
+        entity_ids = type_cache.get(component_type)
+        if entity_ids is None:
+            type_cache[component_type] = {entity.id}
+        else:
+            entity_ids.add(entity.id)
+        self._component_count += 1
         event_queue = self.event_queue
         if event_queue is not None:
             event_queue.append(ComponentAdded(entity, component))
 
     def _component_removed(self, entity: Entity, component: object, /) -> None:
-        entity_ids = self._type_cache[type(component)]
+        component_type = type(component)
+        type_cache = self._type_cache
+        entity_ids = type_cache[component_type]
         entity_ids.remove(entity.id)
         if not entity_ids:
-            del self._type_cache[type(component)]
+            del type_cache[component_type]
+        self._component_count -= 1
         event_queue = self.event_queue
         if event_queue is not None:
             event_queue.append(ComponentRemoved(entity, component))
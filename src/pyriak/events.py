@@ -44,6 +44,8 @@ class EntityAdded:
         entity: The entity added to the manager.
     """
 
+    __slots__ = "entity", "__weakref__"
+
     def __init__(self, entity: "Entity") -> None:
         self.entity = entity
 
@@ -55,6 +57,8 @@ class EntityRemoved:
         entity: The entity removed from the manager.
     """
 
+    __slots__ = "entity", "__weakref__"
+
     def __init__(self, entity: "Entity") -> None:
         self.entity = entity
 
@@ -77,6 +81,8 @@ class ComponentAdded(Generic[_T]):
         component: The component added.
     """
 
+    __slots__ = "entity", "component", "__weakref__"
+
     def __init__(self, entity: "Entity", component: _T) -> None:
         self.entity = entity
         self.component = component
@@ -97,6 +103,8 @@ class ComponentRemoved(Generic[_T]):
         component: The component removed.
     """
 
+    __slots__ = "entity", "component", "__weakref__"
+
     def __init__(self, entity: "Entity", component: _T) -> None:
         self.entity = entity
         self.component = component
@@ -116,6 +124,8 @@ class SystemAdded:
         system: The system added to the manager.
     """
 
+    __slots__ = "system", "__weakref__"
+
     def __init__(self, system: "System") -> None:
         self.system = system
 
@@ -130,6 +140,8 @@ class SystemRemoved:
         system: The system removed from the manager.
     """
 
+    __slots__ = "system", "__weakref__"
+
     def __init__(self, system: "System") -> None:
         self.system = system
 
@@ -148,6 +160,8 @@ class StateAdded(Generic[_T]):
         state: The state added to the manager.
     """
 
+    __slots__ = "state", "__weakref__"
+
     def __init__(self, state: _T) -> None:
         self.state = state
 
@@ -162,6 +176,8 @@ class StateRemoved(Generic[_T]):
         state: The state removed from the manager.
     """
 
+    __slots__ = "state", "__weakref__"
+
     def __init__(self, state: _T) -> None:
         self.state = state
 
@@ -171,6 +187,8 @@ def _handler_key(event: "EventHandlerAdded | EventHandlerRemoved") -> type:
 
 
 class _EventHandlerEvent(Generic[_T]):
+    __slots__ = "_binding", "_handler", "__weakref__"
+
     def __init__(
         self, _binding: "Binding[_T, Any]", _handler: "_EventHandler[_T]"
     ) -> None:
@@ -230,6 +248,8 @@ class EventHandlerAdded(_EventHandlerEvent[_T]):
         keys: The keys of the event handler. May be empty.
     """
 
+    __slots__ = ()
+
 
 @_set_key(_handler_key)
 class EventHandlerRemoved(_EventHandlerEvent[_T]):
@@ -248,3 +268,5 @@ class EventHandlerRemoved(_EventHandlerEvent[_T]):
         event_type: The event type of the event handler.
         keys: The keys of the event handler. May be empty.
     """
+
+    __slots__ = ()
@@ -106,8 +106,8 @@ class StateManager:
         event_queue = self.event_queue
         for state in states:
             state_type = type(state)
-            if state_type in self_states:
-                other_state = self_states[state_type]
+            other_state = self_states.get(state_type, _SENTINEL)
+            if other_state is not _SENTINEL:
                 if other_state is state or other_state == state:
                     continue
                 if event_queue is not None:
@@ -164,11 +164,17 @@ class StateManager:
         Args:
             *states: The states to be removed if in self.
         """
+        self_states = self._states
+        found: dict[type, object] = {}
         for state in states:
-            try:
-                self.remove(state)
-            except ValueError:
-                pass
+            state_type = type(state)
+            if state_type in found or state_type not in self_states:
+                continue
+            other_state = self_states[state_type]
+            if other_state is state or other_state == state:
+                found[state_type] = other_state
+        if found:
+            self.remove(*found.values())
 
     def __getitem__(self, state_type: type[_T], /) -> _T:
         return self._states[state_type]  # type: ignore[return-value]
@@ -218,4 +224,9 @@ class StateManager:
         return obj in self._states
 
     def clear(self) -> None:
-        self.remove(*self)
+        self_states = self._states
+        states = list(self_states.values())
+        self_states.clear()
+        event_queue = self.event_queue
+        if event_queue is not None:
+            event_queue.extend([StateRemoved(state) for state in states])
@@ -398,7 +398,8 @@ class SystemManager:
             handlers = self._handlers[event_type]
         except KeyError:
             return []
-        if event_type not in key_functions:
+        key_function = key_functions.get(event_type)
+        if key_function is None:
             return handlers[:]
         try:
             key_handlers = self._key_handlers[event_type]
@@ -406,7 +407,7 @@ class SystemManager:
             # A key function was added late
             self._key_handlers[event_type] = {}
             return handlers[:]
-        key = key_functions[event_type](event)
+        key = key_function(event)
         if not isinstance(key, Iterator):
             return (key_handlers.get(key, handlers))[:]
         keys = {k for k in key if k in key_handlers}